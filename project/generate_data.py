@@ -5,71 +5,56 @@ import csv
 import json
 import os
 import random
-from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
-from decimal import Decimal, ROUND_HALF_UP
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Tuple
 
+try:
+    import orjson
+except ImportError:  # optional: speeds up --json, stdlib json is used otherwise
+    orjson = None
 
-random.seed(42)
 
+Columns = Dict[str, list]
 
-@dataclass
-class User:
-    user_id: int
-    name: str
-    email: str
-    phone: str
-    created_at: str
+MONEY_FIELDS = ("price", "unit_price", "total_amount", "amount")
+SECONDS_PER_DAY = 86_400
 
 
-@dataclass
-class Product:
-    product_id: int
-    name: str
-    category: str
-    price: str
-    stock: int
+def cents_to_str(values: List[int]) -> List[str]:
+    return [f"{c // 100}.{c % 100:02d}" for c in values]
 
 
-@dataclass
-class Order:
-    order_id: int
-    user_id: int
-    order_date: str
-    total_amount: str
+def format_money(columns: Columns) -> Columns:
+    return {name: cents_to_str(values) if name in MONEY_FIELDS else values for name, values in columns.items()}
 
 
-@dataclass
-class OrderItem:
-    order_item_id: int
-    order_id: int
-    product_id: int
-    quantity: int
-    unit_price: str
+def random_seconds(rng: random.Random, start: datetime, end: datetime, count: int) -> List[int]:
+    # Uniform instants in [start, end], as seconds since midnight of start's day.
+    first = start.hour * 3600 + start.minute * 60 + start.second
+    last = first + int((end - start).total_seconds())
+    return rng.choices(range(first, last + 1), k=count)
 
 
-@dataclass
-class Payment:
-    payment_id: int
-    order_id: int
-    amount: str
-    method: str
-    status: str
-    paid_at: str
+def day_labels(start: datetime, seconds: List[int]) -> List[str]:
+    midnight = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    days = max(seconds, default=0) // SECONDS_PER_DAY + 1
+    return [(midnight + timedelta(days=day)).strftime("%Y-%m-%d") for day in range(days)]
 
 
-def money(value: float) -> str:
-    return str(Decimal(value).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP))
+def format_dates(start: datetime, seconds: List[int]) -> List[str]:
+    labels = day_labels(start, seconds)
+    return [labels[s // SECONDS_PER_DAY] for s in seconds]
 
 
-def random_date(start: datetime, end: datetime) -> datetime:
-    delta = end - start
-    return start + timedelta(seconds=random.randint(0, int(delta.total_seconds())))
+def format_timestamps(start: datetime, seconds: List[int]) -> List[str]:
+    labels = day_labels(start, seconds)
+    return [
+        f"{labels[s // SECONDS_PER_DAY]} {s // 3600 % 24:02d}:{s // 60 % 60:02d}:{s % 60:02d}" for s in seconds
+    ]
 
 
-def generate_users(count: int) -> List[User]:
+def generate_users(rng: random.Random, count: int) -> Columns:
     first_names = [
         "Ava",
         "Liam",
@@ -99,116 +84,119 @@ def generate_users(count: int) -> List[User]:
         "Bennett",
     ]
     today = datetime.utcnow()
-    users = []
-    for uid in range(1, count + 1):
-        first = random.choice(first_names)
-        last = random.choice(last_names)
-        name = f"{first} {last}"
-        email = f"{first}.{last}{uid}@example.com".lower()
-        phone = f"555-{random.randint(200, 999)}-{random.randint(1000, 9999)}"
-        created_at = random_date(today - timedelta(days=365), today - timedelta(days=10))
-        users.append(
-            User(
-                user_id=uid,
-                name=name,
-                email=email,
-                phone=phone,
-                created_at=created_at.strftime("%Y-%m-%d"),
-            )
-        )
-    return users
-
-
-def generate_products(count: int) -> List[Product]:
+    uids = list(range(1, count + 1))
+    firsts = rng.choices(first_names, k=count)
+    lasts = rng.choices(last_names, k=count)
+    areas = rng.choices(range(200, 1000), k=count)
+    lines = rng.choices(range(1000, 10000), k=count)
+    signup_start = today - timedelta(days=365)
+    created_at = random_seconds(rng, signup_start, today - timedelta(days=10), count)
+    return {
+        "user_id": uids,
+        "name": list(map("{} {}".format, firsts, lasts)),
+        "email": list(map("{}.{}{}@example.com".format, map(str.lower, firsts), map(str.lower, lasts), uids)),
+        "phone": list(map("555-{}-{}".format, areas, lines)),
+        "created_at": format_dates(signup_start, created_at),
+    }
+
+
+def generate_products(rng: random.Random, count: int) -> Columns:
     adjectives = ["Aurora", "Summit", "TrailRunner", "Cypress", "Horizon", "Breeze", "Cascade", "Drift"]
     nouns = ["Laptop", "Headphones", "Smartwatch", "Coffee Grinder", "Standing Desk", "Air Purifier", "Water Bottle", "Wireless Mouse"]
     categories = ["Electronics", "Wearables", "Kitchen", "Furniture", "Home", "Outdoors", "Accessories"]
-    products = []
-    for pid in range(1, count + 1):
-        name = f"{random.choice(adjectives)} {random.choice(nouns)}"
-        category = random.choice(categories)
-        base_price = random.uniform(20, 1200)
-        stock = random.randint(20, 400)
-        products.append(
-            Product(
-                product_id=pid,
-                name=name,
-                category=category,
-                price=money(base_price),
-                stock=stock,
-            )
-        )
-    return products
-
-
-def generate_orders(users: List[User], products: List[Product], order_count: int):
+    return {
+        "product_id": list(range(1, count + 1)),
+        "name": [f"{adj} {noun}" for adj, noun in zip(rng.choices(adjectives, k=count), rng.choices(nouns, k=count))],
+        "category": rng.choices(categories, k=count),
+        "price": rng.choices(range(2000, 120001), k=count),
+        "stock": rng.choices(range(20, 401), k=count),
+    }
+
+
+def _build_order_items(rng: random.Random, item_counts: List[int], prices_cents: List[int]):
+    item_total = sum(item_counts)
+    item_order_ids = [0] * item_total
+    item_product_idx = [0] * item_total
+    unit_prices = [0] * item_total
+    quantities = rng.choices(range(1, 4), k=item_total)
+    totals = [0] * len(item_counts)
+
+    sample = rng.sample
+    population = range(len(prices_cents))
+    pos = 0
+    for order_idx, k in enumerate(item_counts):
+        line_total = 0
+        for idx in sample(population, k):
+            price = prices_cents[idx]
+            item_order_ids[pos] = order_idx + 1
+            item_product_idx[pos] = idx
+            unit_prices[pos] = price
+            line_total += price * quantities[pos]
+            pos += 1
+        totals[order_idx] = line_total
+    return item_order_ids, item_product_idx, quantities, unit_prices, totals
+
+
+def generate_orders(rng: random.Random, users: Columns, products: Columns, order_count: int):
     today = datetime.utcnow()
     start_window = today - timedelta(days=120)
-    orders: List[Order] = []
-    items: List[OrderItem] = []
-    payments: List[Payment] = []
-
-    order_item_id = 1
-    payment_id = 1
-    for oid in range(1, order_count + 1):
-        user = random.choice(users)
-        order_date = random_date(start_window, today - timedelta(days=1))
-        product_choices = random.sample(products, k=random.randint(1, min(4, len(products))))
-        line_total = Decimal("0.00")
-        for product in product_choices:
-            qty = random.randint(1, 3)
-            unit_price = Decimal(product.price)
-            line_total += unit_price * qty
-            items.append(
-                OrderItem(
-                    order_item_id=order_item_id,
-                    order_id=oid,
-                    product_id=product.product_id,
-                    quantity=qty,
-                    unit_price=money(unit_price),
-                )
-            )
-            order_item_id += 1
-
-        total_amount = money(line_total)
-        orders.append(
-            Order(
-                order_id=oid,
-                user_id=user.user_id,
-                order_date=order_date.strftime("%Y-%m-%d"),
-                total_amount=total_amount,
-            )
-        )
-
-        status = random.choices(["Completed", "Pending", "Failed"], weights=[0.82, 0.12, 0.06])[0]
-        payment_method = random.choice(["Credit Card", "Debit Card", "PayPal", "Apple Pay"])
-        paid_at = (order_date + timedelta(hours=random.randint(1, 48))).strftime("%Y-%m-%d %H:%M:%S")
-        payments.append(
-            Payment(
-                payment_id=payment_id,
-                order_id=oid,
-                amount=total_amount,
-                method=payment_method,
-                status=status,
-                paid_at=paid_at,
-            )
-        )
-        payment_id += 1
 
+    oids = list(range(1, order_count + 1))
+    user_ids = rng.choices(users["user_id"], k=order_count)
+    order_seconds = random_seconds(rng, start_window, today - timedelta(days=1), order_count)
+    item_counts = rng.choices(range(1, min(4, len(products["product_id"])) + 1), k=order_count)
+    statuses = rng.choices(["Completed", "Pending", "Failed"], weights=[0.82, 0.12, 0.06], k=order_count)
+    methods = rng.choices(["Credit Card", "Debit Card", "PayPal", "Apple Pay"], k=order_count)
+    paid_hours = rng.choices(range(1, 49), k=order_count)
+
+    product_ids = products["product_id"]
+    item_order_ids, item_product_idx, quantities, unit_prices, totals = _build_order_items(
+        rng, item_counts, products["price"]
+    )
+
+    orders = {
+        "order_id": oids,
+        "user_id": user_ids,
+        "order_date": format_dates(start_window, order_seconds),
+        "total_amount": totals,
+    }
+    items = {
+        "order_item_id": list(range(1, len(item_order_ids) + 1)),
+        "order_id": item_order_ids,
+        "product_id": [product_ids[idx] for idx in item_product_idx],
+        "quantity": quantities,
+        "unit_price": unit_prices,
+    }
+    payments = {
+        "payment_id": list(oids),
+        "order_id": oids,
+        "amount": totals,
+        "method": methods,
+        "status": statuses,
+        "paid_at": format_timestamps(start_window, [s + h * 3600 for s, h in zip(order_seconds, paid_hours)]),
+    }
     return orders, items, payments
 
 
-def write_csv(path: Path, rows: List[dataclass], fieldnames: List[str]):
+def iter_rows(columns: Columns, fieldnames: List[str]) -> Iterator[Tuple]:
+    return zip(*(columns[name] for name in fieldnames))
+
+
+def write_csv(path: Path, rows: Iterable[Tuple], fieldnames: List[str]):
     with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(asdict(row))
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
 
 
-def write_json(path: Path, rows: List[dataclass]):
+def write_json(path: Path, columns: Columns):
+    rows = [dict(zip(columns, row)) for row in zip(*columns.values())]
+    if orjson is not None:
+        with path.open("wb") as f:
+            f.write(orjson.dumps(rows, option=orjson.OPT_INDENT_2))
+        return
     with path.open("w", encoding="utf-8") as f:
-        json.dump([asdict(r) for r in rows], f, indent=2)
+        f.write(json.dumps(rows, indent=2))
 
 
 def main():
@@ -216,36 +204,34 @@ def main():
     parser.add_argument("--users", type=int, default=25, help="Number of users to generate")
     parser.add_argument("--products", type=int, default=15, help="Number of products to generate")
     parser.add_argument("--orders", type=int, default=40, help="Number of orders to generate")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for the random generator")
     parser.add_argument("--json", action="store_true", help="Also write .json copies alongside CSVs")
     args = parser.parse_args()
 
     data_dir = Path(__file__).parent / "data"
     os.makedirs(data_dir, exist_ok=True)
 
-    users = generate_users(args.users)
-    products = generate_products(args.products)
-    orders, order_items, payments = generate_orders(users, products, args.orders)
-
-    write_csv(data_dir / "users.csv", users, ["user_id", "name", "email", "phone", "created_at"])
-    write_csv(data_dir / "products.csv", products, ["product_id", "name", "category", "price", "stock"])
-    write_csv(data_dir / "orders.csv", orders, ["order_id", "user_id", "order_date", "total_amount"])
-    write_csv(
-        data_dir / "order_items.csv",
-        order_items,
-        ["order_item_id", "order_id", "product_id", "quantity", "unit_price"],
-    )
-    write_csv(
-        data_dir / "payments.csv",
-        payments,
-        ["payment_id", "order_id", "amount", "method", "status", "paid_at"],
+    rng = random.Random(args.seed)
+    users = generate_users(rng, args.users)
+    products = generate_products(rng, args.products)
+    orders, order_items, payments = generate_orders(rng, users, products, args.orders)
+    users, products, orders, order_items, payments = (
+        format_money(columns) for columns in (users, products, orders, order_items, payments)
     )
 
+    tables = {
+        "users": (users, ["user_id", "name", "email", "phone", "created_at"]),
+        "products": (products, ["product_id", "name", "category", "price", "stock"]),
+        "orders": (orders, ["order_id", "user_id", "order_date", "total_amount"]),
+        "order_items": (order_items, ["order_item_id", "order_id", "product_id", "quantity", "unit_price"]),
+        "payments": (payments, ["payment_id", "order_id", "amount", "method", "status", "paid_at"]),
+    }
+    for name, (columns, fieldnames) in tables.items():
+        write_csv(data_dir / f"{name}.csv", iter_rows(columns, fieldnames), fieldnames)
+
     if args.json:
-        write_json(data_dir / "users.json", users)
-        write_json(data_dir / "products.json", products)
-        write_json(data_dir / "orders.json", orders)
-        write_json(data_dir / "order_items.json", order_items)
-        write_json(data_dir / "payments.json", payments)
+        for name, (columns, _) in tables.items():
+            write_json(data_dir / f"{name}.json", columns)
 
     print(f"Data written to {data_dir.resolve()}")
 
@@ -2,156 +2,186 @@ from __future__ import annotations
 
 import csv
 import sqlite3
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Iterator, List, Tuple
 
 
 DATA_DIR = Path(__file__).parent / "data"
 DB_PATH = Path(__file__).parent / "ecom.db"
 
+BULK_LOAD_PRAGMAS = """
+    PRAGMA journal_mode = MEMORY;
+    PRAGMA synchronous = OFF;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -200000;
+    PRAGMA foreign_keys = OFF;
+"""
+
+INSERT_SQL = {
+    "users": "INSERT INTO users (user_id, name, email, phone, created_at) VALUES (?, ?, ?, ?, ?)",
+    "products": "INSERT INTO products (product_id, name, category, price, stock) VALUES (?, ?, ?, ?, ?)",
+    "orders": "INSERT INTO orders (order_id, user_id, order_date, total_amount) VALUES (?, ?, ?, ?)",
+    "order_items": "INSERT INTO order_items (order_item_id, order_id, product_id, quantity, unit_price) VALUES (?, ?, ?, ?, ?)",
+    "payments": "INSERT INTO payments (payment_id, order_id, amount, method, status, paid_at) VALUES (?, ?, ?, ?, ?, ?)",
+}
+
+TABLE_SCHEMAS = [
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        user_id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        email TEXT NOT NULL,
+        phone TEXT,
+        created_at TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS products (
+        product_id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        category TEXT,
+        price REAL,
+        stock INTEGER
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS orders (
+        order_id INTEGER PRIMARY KEY,
+        user_id INTEGER NOT NULL REFERENCES users(user_id),
+        order_date TEXT,
+        total_amount REAL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS order_items (
+        order_item_id INTEGER PRIMARY KEY,
+        order_id INTEGER NOT NULL REFERENCES orders(order_id),
+        product_id INTEGER NOT NULL REFERENCES products(product_id),
+        quantity INTEGER NOT NULL,
+        unit_price REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS payments (
+        payment_id INTEGER PRIMARY KEY,
+        order_id INTEGER NOT NULL REFERENCES orders(order_id),
+        amount REAL NOT NULL,
+        method TEXT,
+        status TEXT,
+        paid_at TEXT
+    )
+    """,
+]
+
+REPORT_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_orders_user ON orders (user_id, order_id)",
+    "CREATE INDEX IF NOT EXISTS idx_order_items_order "
+    "ON order_items (order_id, order_item_id, product_id, quantity, unit_price)",
+    "CREATE INDEX IF NOT EXISTS idx_payments_order ON payments (order_id)",
+]
+
 
 def ensure_tables(conn: sqlite3.Connection) -> None:
     cur = conn.cursor()
-    cur.executescript(
-        """
-        PRAGMA foreign_keys = ON;
-
-        CREATE TABLE IF NOT EXISTS users (
-            user_id INTEGER PRIMARY KEY,
-            name TEXT NOT NULL,
-            email TEXT NOT NULL,
-            phone TEXT,
-            created_at TEXT
-        );
-
-        CREATE TABLE IF NOT EXISTS products (
-            product_id INTEGER PRIMARY KEY,
-            name TEXT NOT NULL,
-            category TEXT,
-            price REAL,
-            stock INTEGER
-        );
-
-        CREATE TABLE IF NOT EXISTS orders (
-            order_id INTEGER PRIMARY KEY,
-            user_id INTEGER NOT NULL REFERENCES users(user_id),
-            order_date TEXT,
-            total_amount REAL
-        );
-
-        CREATE TABLE IF NOT EXISTS order_items (
-            order_item_id INTEGER PRIMARY KEY,
-            order_id INTEGER NOT NULL REFERENCES orders(order_id),
-            product_id INTEGER NOT NULL REFERENCES products(product_id),
-            quantity INTEGER NOT NULL,
-            unit_price REAL NOT NULL
-        );
-
-        CREATE TABLE IF NOT EXISTS payments (
-            payment_id INTEGER PRIMARY KEY,
-            order_id INTEGER NOT NULL REFERENCES orders(order_id),
-            amount REAL NOT NULL,
-            method TEXT,
-            status TEXT,
-            paid_at TEXT
-        );
-        """
-    )
-    conn.commit()
+    for statement in TABLE_SCHEMAS:
+        cur.execute(statement)
+
+
+def ensure_indexes(conn: sqlite3.Connection) -> None:
+    cur = conn.cursor()
+    for statement in REPORT_INDEXES:
+        cur.execute(statement)
 
 
 def clear_tables(conn: sqlite3.Connection) -> None:
     cur = conn.cursor()
     for table in ["payments", "order_items", "orders", "products", "users"]:
-        cur.execute(f"DELETE FROM {table}")
-    conn.commit()
-
-
-def load_users(path: Path) -> Iterable[Tuple]:
-    with path.open() as f:
-        for row in csv.DictReader(f):
-            yield (
-                int(row["user_id"]),
-                row["name"],
-                row["email"],
-                row["phone"],
-                row["created_at"],
-            )
-
-
-def load_products(path: Path) -> Iterable[Tuple]:
-    with path.open() as f:
-        for row in csv.DictReader(f):
-            yield (
-                int(row["product_id"]),
-                row["name"],
-                row["category"],
-                float(row["price"]),
-                int(row["stock"]),
-            )
-
-
-def load_orders(path: Path) -> Iterable[Tuple]:
-    with path.open() as f:
-        for row in csv.DictReader(f):
-            yield (int(row["order_id"]), int(row["user_id"]), row["order_date"], float(row["total_amount"]))
-
-
-def load_order_items(path: Path) -> Iterable[Tuple]:
-    with path.open() as f:
-        for row in csv.DictReader(f):
-            yield (
-                int(row["order_item_id"]),
-                int(row["order_id"]),
-                int(row["product_id"]),
-                int(row["quantity"]),
-                float(row["unit_price"]),
-            )
-
-
-def load_payments(path: Path) -> Iterable[Tuple]:
-    with path.open() as f:
-        for row in csv.DictReader(f):
-            yield (
-                int(row["payment_id"]),
-                int(row["order_id"]),
-                float(row["amount"]),
-                row["method"],
-                row["status"],
-                row["paid_at"],
-            )
+        cur.execute(f"DROP TABLE IF EXISTS {table}")
+    ensure_tables(conn)
+
+
+def read_rows(path: Path, field_count: int) -> Iterator[List[str]]:
+    with path.open(newline="") as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        for row in reader:
+            if not row:
+                continue
+            if len(row) != field_count:
+                raise SystemExit(f"{path.name} line {reader.line_num}: expected {field_count} fields, got {len(row)}")
+            yield row
+
+
+def load_users(path: Path) -> List[Tuple]:
+    return [
+        (int(user_id), name, email, phone, created_at)
+        for user_id, name, email, phone, created_at in read_rows(path, 5)
+    ]
+
+
+def load_products(path: Path) -> List[Tuple]:
+    return [
+        (int(product_id), name, category, float(price), int(stock))
+        for product_id, name, category, price, stock in read_rows(path, 5)
+    ]
+
+
+def load_orders(path: Path) -> List[Tuple]:
+    return [
+        (int(order_id), int(user_id), order_date, float(total_amount))
+        for order_id, user_id, order_date, total_amount in read_rows(path, 4)
+    ]
+
+
+def load_order_items(path: Path) -> List[Tuple]:
+    return [
+        (int(order_item_id), int(order_id), int(product_id), int(quantity), float(unit_price))
+        for order_item_id, order_id, product_id, quantity, unit_price in read_rows(path, 5)
+    ]
+
+
+def load_payments(path: Path) -> List[Tuple]:
+    return [
+        (int(payment_id), int(order_id), float(amount), method, status, paid_at)
+        for payment_id, order_id, amount, method, status, paid_at in read_rows(path, 6)
+    ]
 
 
 def main():
     if not DATA_DIR.exists():
         raise SystemExit(f"Data directory not found at {DATA_DIR}")
 
-    conn = sqlite3.connect(DB_PATH)
-    ensure_tables(conn)
+    loaders = {
+        "users": load_users,
+        "products": load_products,
+        "orders": load_orders,
+        "order_items": load_order_items,
+        "payments": load_payments,
+    }
+    with ProcessPoolExecutor(max_workers=len(loaders)) as pool:
+        futures = {table: pool.submit(loader, DATA_DIR / f"{table}.csv") for table, loader in loaders.items()}
+        rows = {table: future.result() for table, future in futures.items()}
+
+    conn = sqlite3.connect(DB_PATH, isolation_level=None)
+    conn.executescript(BULK_LOAD_PRAGMAS)
+
+    conn.execute("BEGIN IMMEDIATE")
     clear_tables(conn)
-
     cur = conn.cursor()
-    cur.executemany(
-        "INSERT INTO users (user_id, name, email, phone, created_at) VALUES (?, ?, ?, ?, ?)",
-        load_users(DATA_DIR / "users.csv"),
-    )
-    cur.executemany(
-        "INSERT INTO products (product_id, name, category, price, stock) VALUES (?, ?, ?, ?, ?)",
-        load_products(DATA_DIR / "products.csv"),
-    )
-    cur.executemany(
-        "INSERT INTO orders (order_id, user_id, order_date, total_amount) VALUES (?, ?, ?, ?)",
-        load_orders(DATA_DIR / "orders.csv"),
-    )
-    cur.executemany(
-        "INSERT INTO order_items (order_item_id, order_id, product_id, quantity, unit_price) VALUES (?, ?, ?, ?, ?)",
-        load_order_items(DATA_DIR / "order_items.csv"),
-    )
-    cur.executemany(
-        "INSERT INTO payments (payment_id, order_id, amount, method, status, paid_at) VALUES (?, ?, ?, ?, ?, ?)",
-        load_payments(DATA_DIR / "payments.csv"),
-    )
-    conn.commit()
+    for table, sql in INSERT_SQL.items():
+        cur.executemany(sql, rows[table])
+    ensure_indexes(conn)
+    violations = cur.execute("PRAGMA foreign_key_check").fetchall()
+    if violations:
+        conn.execute("ROLLBACK")
+        conn.close()
+        table, rowid, parent, _ = violations[0]
+        raise SystemExit(
+            f"Foreign key check failed: {len(violations)} row(s), e.g. {table} rowid {rowid} -> missing {parent}"
+        )
+    conn.execute("COMMIT")
+    conn.execute("ANALYZE")
 
     print("Rows inserted:")
     for table in ["users", "products", "orders", "order_items", "payments"]:
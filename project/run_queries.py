@@ -1,37 +1,43 @@
 from __future__ import annotations
 
 import sqlite3
+from itertools import chain
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List, Sequence
 
 
 DB_PATH = Path(__file__).parent / "ecom.db"
+FETCH_BATCH_SIZE = 1024
 
 
-def format_table(headers: List[str], rows: Iterable[Iterable]) -> str:
-    str_rows = [[str(col) for col in row] for row in rows]
-    widths = [len(h) for h in headers]
-    for row in str_rows:
-        for idx, col in enumerate(row):
-            widths[idx] = max(widths[idx], len(col))
+def iter_batches(cur: sqlite3.Cursor) -> Iterator[List[Sequence[str]]]:
+    while batch := cur.fetchmany():
+        yield batch
+
 
-    def fmt_row(row: List[str]) -> str:
-        return " | ".join(col.ljust(widths[idx]) for idx, col in enumerate(row))
+def format_table(headers: List[str], batches: Iterable[List[Sequence[str]]]) -> str:
+    widths = [len(h) for h in headers]
+    rows: List[Sequence[str]] = []
+    for batch in batches:
+        rows.extend(batch)
+        for idx, col in enumerate(zip(*batch)):
+            widths[idx] = max(widths[idx], max(map(len, col)))
+    row_format = " | ".join(f"{{:<{w}}}" for w in widths)
 
     divider = "-+-".join("-" * w for w in widths)
-    output = [fmt_row(headers), divider]
-    output.extend(fmt_row(row) for row in str_rows)
+    output = [row_format.format(*headers), divider]
+    output.extend(row_format.format(*row) for row in rows)
     return "\n".join(output)
 
 
 def fetch_report(conn: sqlite3.Connection):
     query = """
         SELECT
-            u.user_id,
+            CAST(u.user_id AS TEXT) AS user_id,
             u.name,
-            o.order_id,
+            CAST(o.order_id AS TEXT) AS order_id,
             p.name AS product_name,
-            oi.quantity,
+            CAST(oi.quantity AS TEXT) AS quantity,
             printf('%.2f', oi.unit_price) as unit_price,
             printf('%.2f', o.total_amount) as total_amount,
             COALESCE(pay.status, 'N/A') AS payment_status,
@@ -44,18 +50,15 @@ def fetch_report(conn: sqlite3.Connection):
         ORDER BY u.user_id, o.order_id, oi.order_item_id;
     """
     cur = conn.cursor()
+    cur.arraysize = FETCH_BATCH_SIZE
     cur.execute(query)
-    return cur.fetchall()
+    return cur
 
 
 def main():
     if not DB_PATH.exists():
         raise SystemExit("Database not found. Run ingest_to_sqlite.py first.")
 
-    conn = sqlite3.connect(DB_PATH)
-    rows = fetch_report(conn)
-    conn.close()
-
     headers = [
         "user_id",
         "name",
@@ -68,11 +71,17 @@ def main():
         "payment_method",
     ]
 
-    if not rows:
+    conn = sqlite3.connect(DB_PATH)
+    cur = fetch_report(conn)
+    first_batch = cur.fetchmany()
+    if not first_batch:
+        conn.close()
         print("No data found. Verify the database has been populated.")
         return
 
-    print(format_table(headers, rows))
+    report = format_table(headers, chain([first_batch], iter_batches(cur)))
+    conn.close()
+    print(report)
 
 
 if __name__ == "__main__":